@@ -0,0 +1,139 @@
+"""Compare python-docx extraction with the streaming DOCX path.
+
+Run from ai-service/ (Unix only, peak RSS comes from ru_maxrss):
+
+    python -m benchmarks.bench_docx CV.docx [CV2.docx ...]
+    python -m benchmarks.bench_docx --generate sample.docx --media-mb 40
+
+Each extractor runs in a fresh subprocess, so peak RSS includes lxml's C
+allocations, which tracemalloc cannot see. --generate writes a CV-shaped
+DOCX with a table and an incompressible embedded image of the given size.
+"""
+import argparse
+import json
+import os
+import resource
+import struct
+import subprocess
+import sys
+import time
+import zlib
+
+from docx import Document
+from docx.shared import Inches
+
+from services.cv_parser import iter_docx_paragraphs
+
+
+def extract_with_python_docx(file_path):
+    # The previous extract_text DOCX path: full DOM load, paragraphs only
+    doc = Document(file_path)
+    return "\n".join([para.text for para in doc.paragraphs])
+
+
+def extract_streaming(file_path):
+    return "\n".join(iter_docx_paragraphs(file_path))
+
+
+EXTRACTORS = {"python-docx": extract_with_python_docx, "streaming": extract_streaming}
+
+
+def max_rss_bytes():
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def write_noise_png(path, media_mb):
+    # Random RGB pixels so zip compression can't shrink the embedded media
+    side = max(1, int((media_mb * 1024 * 1024 / 3) ** 0.5))
+    rows = b"".join(b"\x00" + os.urandom(side * 3) for _ in range(side))
+
+    def chunk(kind, data):
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF)
+
+    with open(path, "wb") as f:
+        f.write(b"\x89PNG\r\n\x1a\n")
+        f.write(chunk(b"IHDR", struct.pack(">IIBBBBB", side, side, 8, 2, 0, 0, 0)))
+        f.write(chunk(b"IDAT", zlib.compress(rows, 1)))
+        f.write(chunk(b"IEND", b""))
+
+
+def generate_docx(path, media_mb):
+    doc = Document()
+    doc.add_paragraph("Jane Doe")
+    doc.add_paragraph("Skills")
+    table = doc.add_table(rows=3, cols=2)
+    for row, (left, right) in zip(table.rows, [("Python", "React"), ("Node.js", "MongoDB"), ("Docker", "AWS")]):
+        row.cells[0].text = left
+        row.cells[1].text = right
+    doc.add_paragraph("Experience")
+    for i in range(200):
+        doc.add_paragraph(f"Software Engineer {i}\tBuilt and maintained services for team {i}.")
+
+    image_path = path + ".png"
+    write_noise_png(image_path, media_mb)
+    try:
+        doc.add_picture(image_path, width=Inches(4))
+    finally:
+        os.remove(image_path)
+    doc.save(path)
+
+
+def run_child(name, file_path, repeat):
+    """Measure one extractor in this (fresh) process and print JSON."""
+    extract = EXTRACTORS[name]
+    baseline = max_rss_bytes()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        text = extract(file_path)
+    elapsed = (time.perf_counter() - start) / repeat
+    print(json.dumps({
+        "elapsed": elapsed,
+        "peak": max_rss_bytes(),
+        "baseline": baseline,
+        "chars": len(text),
+    }))
+
+
+def measure(name, file_path, repeat):
+    output = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_docx", "--child", name, "--repeat", str(repeat), file_path],
+        check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("files", nargs="*")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--generate", metavar="PATH", help="write a sample DOCX with large embedded media and benchmark it")
+    parser.add_argument("--media-mb", type=float, default=40)
+    parser.add_argument("--child", choices=EXTRACTORS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child, args.files[0], args.repeat)
+        return
+
+    files = list(args.files)
+    if args.generate:
+        generate_docx(args.generate, args.media_mb)
+        files.append(args.generate)
+    if not files:
+        parser.error("pass DOCX files or --generate PATH")
+
+    for file_path in files:
+        print(f"{file_path} ({os.path.getsize(file_path) / 1024 / 1024:.1f} MiB)")
+        for name in EXTRACTORS:
+            result = measure(name, file_path, args.repeat)
+            print(
+                f"  {name:<12} {result['elapsed'] * 1000:8.2f} ms  "
+                f"peak RSS {result['peak'] / 1024 / 1024:7.1f} MiB "
+                f"(+{(result['peak'] - result['baseline']) / 1024 / 1024:.1f} over imports)  "
+                f"{result['chars']:7d} chars"
+            )
+
+
+if __name__ == "__main__":
+    main()
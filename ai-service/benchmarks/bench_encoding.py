@@ -0,0 +1,83 @@
+"""Separate the batching gain from the dedup gain of encode_texts.
+
+Run from ai-service/:  python -m benchmarks.bench_encoding --seekers 200
+"""
+import argparse
+import random
+import time
+
+from services.embeddings import build_job_text, build_seeker_texts, encode_texts
+from services.model_loader import get_model
+
+FIELDS_OF_STUDY = ["Computer Science", "Software Engineering", "Information Technology", "Data Science", ""]
+SKILLS = ["Python", "JavaScript", "React", "Node.js", "MongoDB", "SQL", "Docker", "Java", "AWS", "Git"]
+STATEMENTS = ["Passionate developer looking for a first role.", "Full-stack engineer who enjoys clean code.", ""]
+
+
+def make_payload(n_seekers, seed=42):
+    rng = random.Random(seed)
+    job = {
+        "id": "job-1",
+        "title": "Junior Full Stack Developer",
+        "description": "Build and maintain web applications using React and Node.js.",
+        "requirements": ["JavaScript", "React", "Node.js"],
+        "preferredSkills": ["MongoDB", "Docker"],
+    }
+    seekers = []
+    for i in range(n_seekers):
+        projects = [] if rng.random() < 0.4 else [
+            {"title": "Portfolio site", "technologies": rng.sample(SKILLS, 2)}
+        ]
+        experiences = [] if rng.random() < 0.6 else [
+            {"title": "Intern", "description": "Worked on internal tools."}
+        ]
+        seekers.append({
+            "id": f"seeker-{i}",
+            "skills": sorted(rng.sample(SKILLS, 3)),
+            "statement": rng.choice(STATEMENTS),
+            "fieldOfStudy": rng.choice(FIELDS_OF_STUDY),
+            "projects": projects,
+            "experiences": experiences,
+        })
+    return job, seekers
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seekers", type=int, default=200)
+    args = parser.parse_args()
+
+    job, seekers = make_payload(args.seekers)
+    texts = [build_job_text(job)]
+    for seeker in seekers:
+        texts.extend(build_seeker_texts(seeker))
+
+    model = get_model()
+    model.encode(["warm up"])
+
+    start = time.perf_counter()
+    for text in texts:
+        model.encode([text])
+    per_text = time.perf_counter() - start
+
+    # Same single batch, without deduplication or the empty-text skip
+    start = time.perf_counter()
+    model.encode(texts, normalize_embeddings=True)
+    batched = time.perf_counter() - start
+
+    start = time.perf_counter()
+    _, stats = encode_texts(texts)
+    deduped = time.perf_counter() - start
+
+    print(f"texts:              {stats['total']}")
+    print(f"non-empty:          {stats['nonEmpty']}")
+    print(f"unique:             {stats['unique']} ({stats['unique'] / stats['total']:.1%} of total)")
+    print(f"per-text encode:    {per_text * 1000:.1f} ms")
+    print(f"batched, no dedup:  {batched * 1000:.1f} ms")
+    print(f"batched, deduped:   {deduped * 1000:.1f} ms")
+    print(f"batching saves:     {(per_text - batched) * 1000:.1f} ms ({1 - batched / per_text:.1%})")
+    print(f"dedup saves:        {(batched - deduped) * 1000:.1f} ms ({1 - deduped / batched:.1%})")
+
+
+if __name__ == "__main__":
+    main()
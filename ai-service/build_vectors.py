@@ -0,0 +1,263 @@
+"""Offline bulk embedding of the job and seeker catalogue.
+
+Run from ai-service/:
+
+    python build_vectors.py export.jsonl --out vectors/ --workers 4
+
+Each input line is one job or seeker record, shaped like the payloads sent
+to /recommend-jobs and /recommend-candidates, with "type" set to "job" or
+"seeker". Writes jobs.npy / seekers.npy (float32, records x rows x dim), a
+matching *.hashes.npy of per-text hashes and an id manifest per kind. Progress is checkpointed after every chunk; rerun
+the same command to resume. Start the service with VECTOR_STORE_DIR=vectors/
+to open the result memory-mapped; stored vectors whose text hash still
+matches are used instead of encoding live.
+"""
+import argparse
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from pydantic import ValidationError
+
+from services.embeddings import build_job_text, build_seeker_texts, encode_texts
+from services.model_loader import MODEL_NAME
+from services.schemas import Job, JobSeeker
+from services.scoring import FIELDS
+from services.vector_store import ROWS_PER_RECORD, hashes_path, manifest_path, text_hash, vectors_path
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger("build_vectors")
+
+CHECKPOINT_FILE = "checkpoint.json"
+RECORD_KINDS = {"job": ("jobs", Job), "seeker": ("seekers", JobSeeker)}
+
+
+def read_records(path):
+    """Stream (kind, record) pairs from a JSONL export.
+
+    Records go through the same Pydantic models as the HTTP payloads. Nulls
+    (common in database exports) count as missing, so optional fields fall
+    back to their defaults.
+    """
+    with open(path, encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                raw = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise SystemExit(f"Line {line_no}: invalid JSON: {e}")
+            kind, model = RECORD_KINDS.get(raw.get("type"), (None, None))
+            if kind is None:
+                raise SystemExit(f"Line {line_no}: expected type 'job' or 'seeker', got {raw.get('type')!r}")
+            try:
+                record = model.parse_obj({k: v for k, v in raw.items() if v is not None}).dict()
+            except ValidationError as e:
+                raise SystemExit(f"Line {line_no}: invalid {raw['type']} record: {e}")
+            yield kind, record
+
+
+def record_texts(kind, record):
+    if kind == "jobs":
+        return [build_job_text(record)]
+    return build_seeker_texts(record)
+
+
+def init_worker(threads):
+    # Without this every worker uses all cores for intra-op work
+    import torch
+    torch.set_num_threads(threads)
+
+
+def encode_batch(texts):
+    # Top-level so it can be pickled into worker processes
+    return encode_texts(texts)[0]
+
+
+def load_checkpoint(out_dir):
+    path = os.path.join(out_dir, CHECKPOINT_FILE)
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_checkpoint(out_dir, checkpoint):
+    path = os.path.join(out_dir, CHECKPOINT_FILE)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(checkpoint, f)
+    os.replace(tmp_path, path)
+
+
+def input_fingerprint(input_path):
+    """Size and content hash, so a regenerated export is never resumed into."""
+    digest = hashlib.sha256()
+    with open(input_path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return {"size": os.path.getsize(input_path), "sha256": digest.hexdigest()}
+
+
+def scan_ids(input_path):
+    ids = {kind: [] for kind in ROWS_PER_RECORD}
+    for kind, record in read_records(input_path):
+        ids[kind].append(str(record["id"]))
+    return ids
+
+
+def open_outputs(out_dir, ids, dim, resume):
+    """Create (or reopen on resume) memory-mapped vector and text-hash files per kind."""
+    arrays = {}
+    for kind, kind_ids in ids.items():
+        if not kind_ids:
+            continue
+        if resume:
+            arrays[kind] = (
+                np.load(vectors_path(out_dir, kind), mmap_mode="r+"),
+                np.load(hashes_path(out_dir, kind), mmap_mode="r+"),
+            )
+            continue
+        shape = (len(kind_ids), ROWS_PER_RECORD[kind])
+        arrays[kind] = (
+            np.lib.format.open_memmap(vectors_path(out_dir, kind), mode="w+", dtype=np.float32, shape=shape + (dim,)),
+            # Lets the service tell whether a stored vector still matches a record's current text
+            np.lib.format.open_memmap(hashes_path(out_dir, kind), mode="w+", dtype=np.uint64, shape=shape),
+        )
+        with open(manifest_path(out_dir, kind), "w", encoding="utf-8") as f:
+            json.dump({
+                "model": MODEL_NAME,
+                "dim": dim,
+                "fields": ["job"] if kind == "jobs" else FIELDS,
+                "ids": kind_ids,
+            }, f)
+    return arrays
+
+
+def encode_chunk(chunk, executor, workers):
+    """Encode a chunk of (kind, row, record) into one row block per record."""
+    texts = []
+    for kind, _, record in chunk:
+        texts.extend(record_texts(kind, record))
+
+    batch_size = -(-len(texts) // workers)
+    batches = [texts[i:i + batch_size] for i in range(0, len(texts), batch_size)]
+    if executor is None:
+        vectors = np.concatenate([encode_batch(batch) for batch in batches])
+    else:
+        vectors = np.concatenate(list(executor.map(encode_batch, batches)))
+    return vectors
+
+
+def write_chunk(chunk, vectors, arrays):
+    offset = 0
+    for kind, row, record in chunk:
+        n_rows = ROWS_PER_RECORD[kind]
+        kind_vectors, kind_hashes = arrays[kind]
+        kind_vectors[row] = vectors[offset:offset + n_rows]
+        kind_hashes[row] = [text_hash(text) for text in record_texts(kind, record)]
+        offset += n_rows
+
+    for kind_vectors, kind_hashes in arrays.values():
+        kind_vectors.flush()
+        kind_hashes.flush()
+
+
+def build(input_path, out_dir, workers=1, chunk_size=2048):
+    os.makedirs(out_dir, exist_ok=True)
+    checkpoint = load_checkpoint(out_dir)
+    ids = scan_ids(input_path)
+    counts = {kind: len(kind_ids) for kind, kind_ids in ids.items()}
+    fingerprint = input_fingerprint(input_path)
+
+    if checkpoint is not None:
+        if (checkpoint["input"] != os.path.abspath(input_path)
+                or checkpoint["counts"] != counts
+                or checkpoint.get("fingerprint") != fingerprint):
+            raise SystemExit(f"{out_dir} holds a checkpoint for a different export; use a fresh --out directory")
+        if checkpoint["complete"]:
+            logger.info("Vector store already complete")
+            return
+        logger.info(f"Resuming from {checkpoint['done']}")
+    else:
+        checkpoint = {
+            "input": os.path.abspath(input_path),
+            "counts": counts,
+            "fingerprint": fingerprint,
+            "done": {kind: 0 for kind in counts},
+            "complete": False,
+        }
+
+    # A fresh run opens its outputs once the first chunk reveals the embedding
+    # size, so the parent never loads the model when workers do the encoding
+    resume = checkpoint["done"] != {kind: 0 for kind in counts}
+    arrays = open_outputs(out_dir, ids, None, resume=True) if resume else None
+    save_checkpoint(out_dir, checkpoint)
+
+    def flush(chunk):
+        nonlocal arrays
+        vectors = encode_chunk(chunk, executor, workers)
+        if arrays is None:
+            arrays = open_outputs(out_dir, ids, vectors.shape[1], resume=False)
+        write_chunk(chunk, vectors, arrays)
+
+    executor = None
+    if workers > 1:
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=init_worker,
+            initargs=(max(1, (os.cpu_count() or 1) // workers),),
+        )
+    try:
+        position = {kind: 0 for kind in counts}
+        chunk = []
+        for kind, record in read_records(input_path):
+            row = position[kind]
+            position[kind] += 1
+            if row < checkpoint["done"][kind]:
+                continue
+            chunk.append((kind, row, record))
+            if len(chunk) >= chunk_size:
+                flush(chunk)
+                checkpoint["done"] = dict(position)
+                save_checkpoint(out_dir, checkpoint)
+                logger.info(f"Encoded {checkpoint['done']} of {counts}")
+                chunk = []
+
+        if chunk:
+            flush(chunk)
+        checkpoint["done"] = dict(position)
+        checkpoint["complete"] = True
+        save_checkpoint(out_dir, checkpoint)
+        logger.info(f"Finished: {counts}")
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+
+def positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError("must be at least 1")
+    return number
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build a memory-mapped vector store from a JSONL export.")
+    parser.add_argument("input", help="JSONL file of job and seeker records")
+    parser.add_argument("--out", default="vectors", help="output directory (default: vectors)")
+    parser.add_argument("--workers", type=positive_int, default=max(1, (os.cpu_count() or 1) // 2),
+                        help="encoder processes; torch threads are split evenly between them")
+    parser.add_argument("--chunk-size", type=positive_int, default=2048, help="records per checkpoint")
+    args = parser.parse_args()
+    build(args.input, args.out, workers=args.workers, chunk_size=args.chunk_size)
+
+
+if __name__ == "__main__":
+    main()
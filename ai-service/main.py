@@ -1,6 +1,7 @@
 from fastapi import FastAPI, File, UploadFile
 from fastapi.responses import JSONResponse
 from services.cv_parser import parse_cv
+import hashlib
 import shutil
 import os
 import uuid
@@ -29,47 +30,136 @@ async def parse_cv_file(file: UploadFile = File(...)):
         return JSONResponse(content={"error": str(e)}, status_code=500)
     
 
-from fastapi import Request
-from pydantic import BaseModel
+import anyio.to_thread
+from fastapi import Request, Response
+import json
+from pydantic import ValidationError
 from services.recommender import recommend_jobs
 from services.candidates import recommend_candidates
+from services.vector_store import get_vector_store
+from services.cache import SingleFlight, TTLCache, content_key
+from services.model_loader import MODEL_NAME
+from services.memory import over_budget, profile_stage
+from fastapi.encoders import jsonable_encoder
+from services.schemas import CandidateMatchRequest, MatchRequest, openapi_body
 
-class JobSeeker(BaseModel):
-    id: str
-    name: str = ""
-    skills: list[str]
-    statement: str = ""
-    fieldOfStudy: str = ""
-    projects: list[dict] = []
-    experiences: list[dict] = []
-
-class Job(BaseModel):
-    id: str
-    title: str
-    description: str
-    requirements: list[str] = []
-    preferredSkills: list[str] = []
-
-class MatchRequest(BaseModel):
-    jobSeeker: JobSeeker
-    jobs: list[Job]
-
-class CandidateMatchRequest(BaseModel):
-    job: Job
-    jobSeekers: list[JobSeeker]
-
-@app.post("/recommend-jobs")
-async def get_recommendations(payload: MatchRequest):
+# Identical recommendation requests share one computation and recent results.
+# Entries are (etag, rendered body); the byte budget counts the bodies.
+response_cache = TTLCache(
+    maxsize=int(os.getenv("RESPONSE_CACHE_SIZE", "128")),
+    ttl=float(os.getenv("RESPONSE_CACHE_TTL", "120")),
+    maxbytes=int(float(os.getenv("RESPONSE_CACHE_MB", "16")) * 1024 * 1024),
+    sizeof=lambda entry: len(entry[1]),
+)
+inflight = SingleFlight()
+
+# Cap on recommendations computed at once; each holds its embeddings in memory
+RECOMMEND_CONCURRENCY = int(os.getenv("RECOMMEND_CONCURRENCY", "2"))
+compute_limiter = None
+
+def get_compute_limiter():
+    # Created lazily: the limiter has to be made inside the running event loop
+    global compute_limiter
+    if compute_limiter is None:
+        compute_limiter = anyio.CapacityLimiter(RECOMMEND_CONCURRENCY)
+    return compute_limiter
+
+@app.on_event("startup")
+def open_vector_store():
+    # Memory-maps the offline-built vectors (see build_vectors.py) when VECTOR_STORE_DIR is set
+    get_vector_store()
+
+def etag_matches(request: Request, etag: str, was_cached: bool) -> bool:
+    header = request.headers.get("if-none-match", "")
+    # If-None-Match uses weak comparison, so W/"x" matches "x"
+    tags = [tag.strip().removeprefix("W/") for tag in header.split(",")]
+    # "*" only matches a result that existed before this request
+    return etag in tags or (was_cached and "*" in tags)
+
+async def cached_response(request: Request, key: str, compute):
+    """Serve a recommendation from the response cache or a single shared computation.
+
+    The ETag is a hash of the rendered body. A matching If-None-Match gets 412,
+    which RFC 9110 prescribes for POST, and tells the client its copy is current.
+    """
+    def render():
+        result = compute()
+        with profile_stage("serialization"):
+            body = JSONResponse(content=result).body
+        entry = (f'"{hashlib.sha256(body).hexdigest()}"', body)
+        # Cached before the shared task completes, so no request falls in a gap;
+        # skipped under memory pressure so the chunked path holds nothing extra
+        if not over_budget():
+            response_cache.set(key, entry)
+        return entry
+
+    entry = response_cache.get(key)
+    was_cached = entry is not None
+    if not was_cached:
+        entry = await inflight.run(
+            key, lambda: anyio.to_thread.run_sync(render, limiter=get_compute_limiter())
+        )
+
+    etag, body = entry
+    headers = {"ETag": etag}
+    if etag_matches(request, etag, was_cached):
+        return Response(status_code=412, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+def validation_error(errors):
+    # Same shape FastAPI returns when it validates the body itself
+    detail = [{**error, "loc": ["body", *error["loc"]]} for error in errors]
+    return JSONResponse(content={"detail": jsonable_encoder(detail)}, status_code=422)
+
+def json_error(e: json.JSONDecodeError):
+    return validation_error([{
+        "type": "json_invalid", "loc": (e.pos,), "msg": "JSON decode error", "ctx": {"error": e.msg},
+    }])
+
+async def parse_payload(request: Request, model):
+    """Decode and validate the body inside the profiled parsing stage.
+
+    The handlers take the raw Request so the Pydantic objects are measured
+    and dropped here; openapi_body keeps the documented schema. Only one plain
+    dict copy outlives parsing and serves as both the cache key input and the
+    recommender input.
+    """
+    with profile_stage("parsing"):
+        payload = model.parse_obj(await request.json())
+        return payload.dict()
+
+@app.post("/recommend-jobs", openapi_extra=openapi_body(MatchRequest))
+async def get_recommendations(request: Request):
     try:
-        result = recommend_jobs(payload.jobSeeker.dict(), [j.dict() for j in payload.jobs])
-        return {"recommendedJobs": result}
+        data = await parse_payload(request, MatchRequest)
+        return await cached_response(
+            request,
+            content_key(MODEL_NAME, "recommend-jobs", data),
+            lambda: {"recommendedJobs": recommend_jobs(
+                data["jobSeeker"], data["jobs"], profile=data["weightProfile"]
+            )},
+        )
+    except ValidationError as e:
+        return validation_error(e.errors())
+    except json.JSONDecodeError as e:
+        return json_error(e)
     except Exception as e:
         return JSONResponse(content={"error": str(e)}, status_code=500)
     
-@app.post("/recommend-candidates")
-async def get_candidate_suggestions(payload: CandidateMatchRequest):
+@app.post("/recommend-candidates", openapi_extra=openapi_body(CandidateMatchRequest))
+async def get_candidate_suggestions(request: Request):
     try:
-        result = recommend_candidates(payload.job.dict(), [s.dict() for s in payload.jobSeekers])
-        return {"recommendedCandidates": result}
+        data = await parse_payload(request, CandidateMatchRequest)
+        return await cached_response(
+            request,
+            content_key(MODEL_NAME, "recommend-candidates", data),
+            lambda: {"recommendedCandidates": recommend_candidates(
+                data["job"], data["jobSeekers"], profile=data["weightProfile"]
+            )},
+        )
+    except ValidationError as e:
+        return validation_error(e.errors())
+    except json.JSONDecodeError as e:
+        return json_error(e)
     except Exception as e:
         return {"error": str(e)}
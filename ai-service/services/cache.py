@@ -0,0 +1,88 @@
+import asyncio
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+
+
+def content_key(*parts):
+    """Stable SHA-256 of JSON-serialisable request content."""
+    raw = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class TTLCache:
+    """Small thread-safe LRU cache whose entries expire after `ttl` seconds.
+
+    With `maxbytes`, entries are also evicted once the total of `sizeof(value)`
+    exceeds it; a single value larger than the budget is not kept at all.
+    """
+
+    def __init__(self, maxsize=128, ttl=300, maxbytes=None, sizeof=len):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.maxbytes = maxbytes
+        self.sizeof = sizeof
+        self.nbytes = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _pop(self, key):
+        _, _, size = self._data.pop(key)
+        self.nbytes -= size
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value, _ = entry
+            if expires_at < time.monotonic():
+                self._pop(key)
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        size = self.sizeof(value) if self.maxbytes is not None else 0
+        with self._lock:
+            if key in self._data:
+                self._pop(key)
+            if self.maxbytes is not None and size > self.maxbytes:
+                return
+            now = time.monotonic()
+            # Expired entries go before any live one is evicted
+            for expired in [k for k, (expires_at, _, _) in self._data.items() if expires_at < now]:
+                self._pop(expired)
+            self._data[key] = (now + self.ttl, value, size)
+            self.nbytes += size
+            while self._data and (
+                len(self._data) > self.maxsize
+                or (self.maxbytes is not None and self.nbytes > self.maxbytes)
+            ):
+                self._pop(next(iter(self._data)))
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.nbytes = 0
+
+    def __len__(self):
+        return len(self._data)
+
+
+class SingleFlight:
+    """Share one in-flight computation between concurrent callers of the same key."""
+
+    def __init__(self):
+        self._inflight = {}
+
+    async def run(self, key, compute):
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(compute())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shielded so one caller disconnecting doesn't cancel the others' result
+        return await asyncio.shield(task)
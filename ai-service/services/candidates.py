@@ -1,12 +1,8 @@
 import numpy as np
-from services.model_loader import get_model
-
-def compute_embedding(text):
-    model = get_model()
-    return model.encode([text])[0]
-
-def cosine_similarity_np(a, b):
-    return float(np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b)))
+from services.embeddings import build_job_text, build_seeker_texts, encode_texts
+from services.memory import chunk_size_for, profile_stage
+from services.vector_store import stored_vectors
+from services.scoring import FIELDS, cached_similarity_matrix, get_weights
 
 def get_match_label(score):
     if score >= 80:
@@ -21,59 +17,48 @@ def get_match_label(score):
 def safe_float(val):
     return float(np.round(val * 100, 2))
 
-def recommend_candidates(job, seekers):
-    job_text = (
-        job["title"] + " " +
-        job["description"] + " " +
-        " ".join(job.get("requirements", []) + job.get("preferredSkills", []))
-    )
-    job_embedding = compute_embedding(job_text)
-
-    results = []
+def candidate_similarity_matrix(job, seekers):
+    job_texts = [build_job_text(job)]
+    job_vectors, _ = encode_texts(job_texts, known=stored_vectors("jobs", job["id"], job_texts))
+    job_vector = job_vectors[0]
+    matrix = np.zeros((len(seekers), len(FIELDS)), dtype=np.float64)
 
-    for seeker in seekers:
-        skill_text = " ".join(seeker.get("skills", []))
-        statement = seeker.get("statement", "")
-        projects_text = " ".join([
-            p.get("title", "") + " " + " ".join(p.get("technologies", []))
-            for p in seeker.get("projects", [])
-        ])
-        experience_text = " ".join([
-            e.get("title", "") + " " + e.get("description", "")
-            for e in seeker.get("experiences", [])
-        ])
-        field_of_study = seeker.get("fieldOfStudy", "")
+    chunk_size = chunk_size_for(len(seekers))
+    for start in range(0, len(seekers), chunk_size):
+        chunk = seekers[start:start + chunk_size]
+        texts = []
+        known = []
+        for seeker in chunk:
+            seeker_texts = build_seeker_texts(seeker)
+            texts.extend(seeker_texts)
+            known.extend(stored_vectors("seekers", seeker["id"], seeker_texts))
+        vectors, _ = encode_texts(texts, known=known)
 
-        seeker_embeddings = {
-            "skills": compute_embedding(skill_text),
-            "statement": compute_embedding(statement),
-            "projects": compute_embedding(projects_text),
-            "experience": compute_embedding(experience_text),
-            "fieldOfStudy": compute_embedding(field_of_study),
-        }
+        seeker_vectors = vectors.reshape(len(chunk), len(FIELDS), vectors.shape[1])
+        # Unit-length rows, so the dot product is the cosine (0 for empty fields)
+        matrix[start:start + len(chunk)] = seeker_vectors @ job_vector
 
-        scores = {
-            "skills": cosine_similarity_np(seeker_embeddings["skills"], job_embedding),
-            "statement": cosine_similarity_np(seeker_embeddings["statement"], job_embedding),
-            "projects": cosine_similarity_np(seeker_embeddings["projects"], job_embedding),
-            "experience": cosine_similarity_np(seeker_embeddings["experience"], job_embedding),
-            "fieldOfStudy": cosine_similarity_np(seeker_embeddings["fieldOfStudy"], job_embedding),
-        }
+    return matrix
 
-        weighted_score = (
-            scores["skills"] * 0.5 +
-            scores["projects"] * 0.25 +
-            scores["experience"] * 0.1 +
-            scores["statement"] * 0.1 +
-            scores["fieldOfStudy"] * 0.05
+def recommend_candidates(job, seekers, profile=None):
+    weights = get_weights("candidates", profile)
+    with profile_stage("encoding"):
+        matrix = cached_similarity_matrix(
+            "candidates", [job, seekers], lambda: candidate_similarity_matrix(job, seekers)
         )
 
-        results.append({
-            "id": seeker["id"],
-            "name": seeker.get("name", ""),
-            "similarity": safe_float(weighted_score),
-            "matchLabel": get_match_label(weighted_score * 100),
-            "details": {k: safe_float(v) for k, v in scores.items()}
-        })
+    with profile_stage("scoring"):
+        weighted = matrix @ weights
+
+        results = []
+
+        for seeker, scores, weighted_score in zip(seekers, matrix, weighted):
+            results.append({
+                "id": seeker["id"],
+                "name": seeker.get("name", ""),
+                "similarity": safe_float(weighted_score),
+                "matchLabel": get_match_label(weighted_score * 100),
+                "details": {field: safe_float(v) for field, v in zip(FIELDS, scores)}
+            })
 
-    return sorted(results, key=lambda x: x["similarity"], reverse=True)
+        return sorted(results, key=lambda x: x["similarity"], reverse=True)
@@ -1,5 +1,6 @@
 import re
-from docx import Document
+import zipfile
+from xml.etree.ElementTree import iterparse
 from PyPDF2 import PdfReader
 from typing import List, Dict, Optional
 from dateutil import parser
@@ -9,6 +10,56 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+MC_NS = "{http://schemas.openxmlformats.org/markup-compatibility/2006}"
+
+# Property blocks (tab stops etc.) and mc:Fallback copies of text boxes hold no reading text
+SKIPPED_TAGS = {W_NS + "pPr", W_NS + "rPr", MC_NS + "Fallback"}
+
+def iter_docx_paragraphs(file_path: str):
+    """Stream paragraph text (including table cells) from a DOCX in document order.
+
+    Reads word/document.xml straight out of the zip with an incremental parser,
+    so embedded media is never loaded and memory stays bounded. Text box
+    paragraphs are emitted on their own lines after the paragraph they sit in.
+    """
+    with zipfile.ZipFile(file_path) as archive:
+        with archive.open("word/document.xml") as document:
+            # One (text parts, nested paragraph lines) entry per open w:p
+            stack = []
+            skip = 0
+            for event, elem in iterparse(document, events=("start", "end")):
+                tag = elem.tag
+                if tag in SKIPPED_TAGS:
+                    skip += 1 if event == "start" else -1
+                    continue
+                if skip:
+                    continue
+
+                if event == "start":
+                    if tag == W_NS + "p":
+                        stack.append(([], []))
+                    continue
+
+                if tag == W_NS + "p":
+                    parts, nested = stack.pop()
+                    lines = ["".join(parts)] + nested
+                    if stack:
+                        stack[-1][1].extend(lines)
+                    else:
+                        yield from lines
+                    elem.clear()
+                elif tag in (W_NS + "tbl", W_NS + "sdt"):
+                    elem.clear()
+                elif not stack:
+                    continue
+                elif tag == W_NS + "t":
+                    stack[-1][0].append(elem.text or "")
+                elif tag == W_NS + "tab":
+                    stack[-1][0].append("\t")
+                elif tag in (W_NS + "br", W_NS + "cr"):
+                    stack[-1][0].append("\n")
+
 def extract_text(file_path: str) -> str:
     """Extract text from PDF or DOCX files."""
     try:
@@ -16,8 +67,7 @@ def extract_text(file_path: str) -> str:
             reader = PdfReader(file_path)
             return "\n".join([page.extract_text() or '' for page in reader.pages])
         elif file_path.endswith('.docx'):
-            doc = Document(file_path)
-            return "\n".join([para.text for para in doc.paragraphs])
+            return "\n".join(iter_docx_paragraphs(file_path))
         return ""
     except Exception as e:
         logger.error(f"Error extracting text from {file_path}: {e}")
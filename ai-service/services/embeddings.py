@@ -0,0 +1,78 @@
+import logging
+import numpy as np
+from services.model_loader import get_model
+from services.scoring import FIELDS
+
+logger = logging.getLogger(__name__)
+
+
+def build_job_text(job):
+    return job["title"] + " " + job["description"] + " " + " ".join(
+        job.get("requirements", []) + job.get("preferredSkills", [])
+    )
+
+
+def build_seeker_texts(seeker):
+    """Return the seeker's field texts in FIELDS order."""
+    texts = {
+        "skills": " ".join(seeker.get("skills", [])),
+        "statement": seeker.get("statement", ""),
+        "projects": " ".join([
+            p.get("title", "") + " " + " ".join(p.get("technologies", []))
+            for p in seeker.get("projects", [])
+        ]),
+        "experience": " ".join([
+            e.get("title", "") + " " + e.get("description", "")
+            for e in seeker.get("experiences", [])
+        ]),
+        "fieldOfStudy": seeker.get("fieldOfStudy", ""),
+    }
+    return [texts[field] for field in FIELDS]
+
+
+def encode_texts(texts, known=None):
+    """Encode texts, sending each unique non-empty string to the model once.
+
+    Returns unit-length embeddings, one row per input text. Empty texts get
+    a zero row, so their cosine against anything is a defined 0. `known` may
+    give a precomputed vector (or None) per text, e.g. from the backfilled
+    vector store; those texts skip the model.
+    """
+    unique = {}
+    stored = {}
+    index = np.full(len(texts), -1, dtype=np.int64)
+
+    for i, text in enumerate(texts):
+        key = text.strip()
+        if not key:
+            continue
+        if known is not None and known[i] is not None:
+            stored[i] = known[i]
+        else:
+            index[i] = unique.setdefault(key, len(unique))
+
+    stats = {
+        "total": len(texts),
+        "nonEmpty": len(stored) + int((index >= 0).sum()),
+        "unique": len(unique),
+        "stored": len(stored),
+    }
+    logger.debug(f"Encoding {stats['unique']} unique of {stats['total']} texts ({stats['stored']} stored)")
+
+    encoded = None
+    if unique:
+        encoded = get_model().encode(list(unique), normalize_embeddings=True)
+        dim = encoded.shape[1]
+    elif stored:
+        dim = len(next(iter(stored.values())))
+    else:
+        dim = get_model().get_sentence_embedding_dimension()
+
+    vectors = np.zeros((len(texts), dim), dtype=np.float32)
+    if encoded is not None:
+        present = index >= 0
+        vectors[present] = encoded[index[present]]
+    for i, vector in stored.items():
+        vectors[i] = vector
+
+    return vectors, stats
@@ -0,0 +1,66 @@
+import logging
+import os
+import tracemalloc
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+# MEMORY_PROFILE=1 logs peak Python allocations for each request stage
+MEMORY_PROFILE = os.getenv("MEMORY_PROFILE", "").lower() in ("1", "true", "yes")
+
+# Above RSS_BUDGET_MB, requests with more than CHUNK_SIZE items are processed in chunks
+RSS_BUDGET_MB = float(os.getenv("RSS_BUDGET_MB", "0"))
+CHUNK_SIZE = int(os.getenv("MEMORY_CHUNK_SIZE", "64"))
+
+MIB = 1024 * 1024
+
+
+@contextmanager
+def profile_stage(name):
+    """Log the peak traced allocation of a stage when MEMORY_PROFILE is on.
+
+    tracemalloc is process-wide, so figures from overlapping requests mix;
+    profile with one request at a time.
+    """
+    if not MEMORY_PROFILE:
+        yield
+        return
+
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    try:
+        yield
+    finally:
+        current, peak = tracemalloc.get_traced_memory()
+        logger.info(
+            f"[memory] {name}: peak {(peak - start) / MIB:.1f} MiB above start, "
+            f"retained {(current - start) / MIB:+.1f} MiB, rss {rss_bytes() / MIB:.1f} MiB"
+        )
+
+
+def rss_bytes():
+    """Current resident set size of this process, read from /proc.
+
+    Returns 0 where /proc is unavailable (macOS, Windows), which disables
+    the budget: the portable alternative, ru_maxrss, is a high-water mark
+    that would leave every later large request chunked.
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return 0
+
+
+def over_budget():
+    return RSS_BUDGET_MB > 0 and rss_bytes() > RSS_BUDGET_MB * MIB
+
+
+def chunk_size_for(n_items):
+    """How many items to encode at once: all of them unless over the RSS budget."""
+    if n_items > CHUNK_SIZE and over_budget():
+        logger.warning(f"RSS above {RSS_BUDGET_MB:.0f} MiB budget; processing {n_items} items in chunks of {CHUNK_SIZE}")
+        return CHUNK_SIZE
+    return max(n_items, 1)
@@ -1,17 +1,24 @@
+import threading
 from sentence_transformers import SentenceTransformer
 
+# use CPU-friendly model
+MODEL_NAME = "sentence-transformers/paraphrase-MiniLM-L6-v2"
+
 def load_model():
-    # use CPU-friendly model
     return SentenceTransformer(
-        "sentence-transformers/paraphrase-MiniLM-L6-v2",
+        MODEL_NAME,
         device="cpu"
     )
 
 # Lazy-load model (prevents issues on Render)
 model = None
+# Recommendations run in threadpool workers; only one of them may load the model
+model_lock = threading.Lock()
 
 def get_model():
     global model
     if model is None:
-        model = load_model()
+        with model_lock:
+            if model is None:
+                model = load_model()
     return model
@@ -1,12 +1,8 @@
 import numpy as np
-from services.model_loader import get_model
-
-def compute_embedding(text):
-    model = get_model()
-    return model.encode([text])[0]
-
-def cosine_similarity_np(a, b):
-    return float(np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b)))
+from services.embeddings import build_job_text, build_seeker_texts, encode_texts
+from services.memory import chunk_size_for, profile_stage
+from services.vector_store import stored_vectors
+from services.scoring import FIELDS, cached_similarity_matrix, get_weights
 
 def get_match_label(score):
     if score >= 80:
@@ -21,58 +17,44 @@ def get_match_label(score):
 def safe_float(val):
     return float(np.round(val * 100, 2))
 
-def recommend_jobs(seeker, jobs):
-    skill_text = " ".join(seeker.get("skills", []))
-    statement = seeker.get("statement", "")
-    projects_text = " ".join([
-        p.get("title", "") + " " + " ".join(p.get("technologies", []))
-        for p in seeker.get("projects", [])
-    ])
-    experience_text = " ".join([
-        e.get("title", "") + " " + e.get("description", "")
-        for e in seeker.get("experiences", [])
-    ])
-    field_of_study = seeker.get("fieldOfStudy", "")
-
-    seeker_embeddings = {
-        "skills": compute_embedding(skill_text),
-        "statement": compute_embedding(statement),
-        "projects": compute_embedding(projects_text),
-        "experience": compute_embedding(experience_text),
-        "fieldOfStudy": compute_embedding(field_of_study),
-    }
-
-    results = []
-
-    for job in jobs:
-        job_text = job["title"] + " " + job["description"] + " " + " ".join(
-            job.get("requirements", []) + job.get("preferredSkills", [])
+def job_similarity_matrix(seeker, jobs):
+    seeker_texts = build_seeker_texts(seeker)
+    seeker_vectors, _ = encode_texts(
+        seeker_texts, known=stored_vectors("seekers", seeker["id"], seeker_texts)
+    )
+    matrix = np.zeros((len(jobs), len(FIELDS)), dtype=np.float64)
+
+    chunk_size = chunk_size_for(len(jobs))
+    for start in range(0, len(jobs), chunk_size):
+        chunk = jobs[start:start + chunk_size]
+        texts = [build_job_text(job) for job in chunk]
+        known = [stored_vectors("jobs", job["id"], [text])[0] for job, text in zip(chunk, texts)]
+        job_vectors, _ = encode_texts(texts, known=known)
+        # Unit-length rows, so the dot product is the cosine (0 for empty fields)
+        matrix[start:start + len(job_vectors)] = job_vectors @ seeker_vectors.T
+
+    return matrix
+
+def recommend_jobs(seeker, jobs, profile=None):
+    weights = get_weights("jobs", profile)
+    with profile_stage("encoding"):
+        matrix = cached_similarity_matrix(
+            "jobs", [seeker, jobs], lambda: job_similarity_matrix(seeker, jobs)
         )
-        job_embedding = compute_embedding(job_text)
 
-        scores = {
-            "skills": cosine_similarity_np(seeker_embeddings["skills"], job_embedding),
-            "statement": cosine_similarity_np(seeker_embeddings["statement"], job_embedding),
-            "projects": cosine_similarity_np(seeker_embeddings["projects"], job_embedding),
-            "experience": cosine_similarity_np(seeker_embeddings["experience"], job_embedding),
-            "fieldOfStudy": cosine_similarity_np(seeker_embeddings["fieldOfStudy"], job_embedding),
-        }
+    with profile_stage("scoring"):
+        weighted = matrix @ weights
 
-        weighted_score = (
-            scores["skills"] * 0.4 +
-            scores["projects"] * 0.2 +
-            scores["experience"] * 0.2 +
-            scores["statement"] * 0.1 +
-            scores["fieldOfStudy"] * 0.1
-        )
+        results = []
 
-        results.append({
-            "id": job["id"],
-            "title": job["title"],
-            "description": job["description"],
-            "similarity": safe_float(weighted_score),
-            "matchLabel": get_match_label(weighted_score * 100),
-            "details": {k: safe_float(v) for k, v in scores.items()}
-        })
+        for job, scores, weighted_score in zip(jobs, matrix, weighted):
+            results.append({
+                "id": job["id"],
+                "title": job["title"],
+                "description": job["description"],
+                "similarity": safe_float(weighted_score),
+                "matchLabel": get_match_label(weighted_score * 100),
+                "details": {field: safe_float(v) for field, v in zip(FIELDS, scores)}
+            })
 
-    return sorted(results, key=lambda x: x["similarity"], reverse=True)
+        return sorted(results, key=lambda x: x["similarity"], reverse=True)
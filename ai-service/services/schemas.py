@@ -0,0 +1,61 @@
+from pydantic import BaseModel, validator
+from services.scoring import DEFAULT_PROFILE, check_profile
+
+class JobSeeker(BaseModel):
+    id: str
+    name: str = ""
+    skills: list[str]
+    statement: str = ""
+    fieldOfStudy: str = ""
+    projects: list[dict] = []
+    experiences: list[dict] = []
+
+class Job(BaseModel):
+    id: str
+    title: str
+    description: str
+    requirements: list[str] = []
+    preferredSkills: list[str] = []
+
+class MatchRequest(BaseModel):
+    jobSeeker: JobSeeker
+    jobs: list[Job]
+    weightProfile: str = DEFAULT_PROFILE
+
+    @validator("weightProfile")
+    def known_profile(cls, value):
+        return check_profile("jobs", value)
+
+class CandidateMatchRequest(BaseModel):
+    job: Job
+    jobSeekers: list[JobSeeker]
+    weightProfile: str = DEFAULT_PROFILE
+
+    @validator("weightProfile")
+    def known_profile(cls, value):
+        return check_profile("candidates", value)
+
+
+def openapi_body(model):
+    """openapi_extra documenting `model` as the body of a handler that parses it itself.
+
+    Nested model references are inlined so the schema stands alone.
+    """
+    schema = model.schema()
+    definitions = schema.pop("definitions", None) or schema.pop("$defs", {})
+
+    def resolve(node):
+        if isinstance(node, dict):
+            if "$ref" in node:
+                return resolve(definitions[node["$ref"].rsplit("/", 1)[-1]])
+            return {key: resolve(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [resolve(value) for value in node]
+        return node
+
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": resolve(schema)}},
+        }
+    }
@@ -0,0 +1,68 @@
+import os
+import numpy as np
+from services.cache import TTLCache, content_key
+from services.memory import over_budget
+
+# Column order of the per-field similarity matrix (items x fields)
+FIELDS = ["skills", "statement", "projects", "experience", "fieldOfStudy"]
+
+# Named weight profiles, selectable per request via `weightProfile`
+WEIGHT_PROFILES = {
+    "jobs": {
+        "default": {"skills": 0.4, "statement": 0.1, "projects": 0.2, "experience": 0.2, "fieldOfStudy": 0.1},
+        "balanced": {"skills": 0.2, "statement": 0.2, "projects": 0.2, "experience": 0.2, "fieldOfStudy": 0.2},
+        "skills_first": {"skills": 0.6, "statement": 0.05, "projects": 0.15, "experience": 0.15, "fieldOfStudy": 0.05},
+        "experience_first": {"skills": 0.3, "statement": 0.05, "projects": 0.15, "experience": 0.45, "fieldOfStudy": 0.05},
+    },
+    "candidates": {
+        "default": {"skills": 0.5, "statement": 0.1, "projects": 0.25, "experience": 0.1, "fieldOfStudy": 0.05},
+        "balanced": {"skills": 0.2, "statement": 0.2, "projects": 0.2, "experience": 0.2, "fieldOfStudy": 0.2},
+        "skills_first": {"skills": 0.6, "statement": 0.05, "projects": 0.2, "experience": 0.1, "fieldOfStudy": 0.05},
+        "experience_first": {"skills": 0.3, "statement": 0.05, "projects": 0.15, "experience": 0.45, "fieldOfStudy": 0.05},
+    },
+}
+
+DEFAULT_PROFILE = "default"
+
+# Similarity matrices are kept briefly so re-ranking with another profile
+# is a NumPy reweight instead of another round of model calls.
+similarity_cache = TTLCache(
+    maxsize=int(os.getenv("SIMILARITY_CACHE_SIZE", "256")),
+    ttl=float(os.getenv("SIMILARITY_CACHE_TTL", "300")),
+)
+
+
+class UnknownProfileError(ValueError):
+    pass
+
+
+def check_profile(kind, profile):
+    """Raise UnknownProfileError unless `profile` names a profile for `kind`."""
+    profiles = WEIGHT_PROFILES[kind]
+    name = profile or DEFAULT_PROFILE
+    if name not in profiles:
+        raise UnknownProfileError(
+            f"Unknown weight profile '{name}'. Available: {', '.join(sorted(profiles))}"
+        )
+    return name
+
+
+def get_weights(kind, profile=None):
+    """Return the weight vector (in FIELDS order) for a named profile."""
+    weights = WEIGHT_PROFILES[kind][check_profile(kind, profile)]
+    return np.array([weights[field] for field in FIELDS], dtype=np.float64)
+
+
+def cached_similarity_matrix(kind, content, compute):
+    """Fetch the similarity matrix for `content`, computing it on a miss.
+
+    Nothing new is cached while the process is over its RSS budget.
+    """
+    key = content_key(kind, content)
+    matrix = similarity_cache.get(key)
+    if matrix is None:
+        matrix = compute()
+        if not over_budget():
+            similarity_cache.set(key, matrix)
+    return matrix
+
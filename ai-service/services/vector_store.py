@@ -0,0 +1,99 @@
+import hashlib
+import json
+import logging
+import os
+import numpy as np
+from services.model_loader import MODEL_NAME
+from services.scoring import FIELDS
+
+logger = logging.getLogger(__name__)
+
+# Vectors per record: one for the job text, one per seeker field
+ROWS_PER_RECORD = {"jobs": 1, "seekers": len(FIELDS)}
+
+VECTOR_STORE_DIR = os.getenv("VECTOR_STORE_DIR", "")
+
+
+def vectors_path(directory, kind):
+    return os.path.join(directory, f"{kind}.npy")
+
+
+def hashes_path(directory, kind):
+    return os.path.join(directory, f"{kind}.hashes.npy")
+
+
+def manifest_path(directory, kind):
+    return os.path.join(directory, f"{kind}.ids.json")
+
+
+def text_hash(text):
+    """64-bit hash of the text a vector was encoded from (0 is never produced)."""
+    digest = hashlib.blake2b(text.strip().encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little") or 1
+
+
+class VectorStore:
+    """Read-only view over memory-mapped vectors, their text hashes and ids."""
+
+    def __init__(self, vectors, hashes, manifest):
+        self.vectors = vectors
+        self.hashes = hashes
+        self.ids = manifest["ids"]
+        self.fields = manifest.get("fields", [])
+        self._rows = {record_id: row for row, record_id in enumerate(self.ids)}
+
+    def lookup(self, record_id, texts):
+        """Stored vectors for a record's texts; None where the text changed since the build."""
+        row = self._rows.get(record_id)
+        if row is None:
+            return [None] * len(texts)
+        return [
+            self.vectors[row, i] if int(self.hashes[row, i]) == text_hash(text) else None
+            for i, text in enumerate(texts)
+        ]
+
+    def __contains__(self, record_id):
+        return record_id in self._rows
+
+    def __len__(self):
+        return len(self.ids)
+
+
+def open_vector_store(directory):
+    """Open every kind present in `directory` without copying it into memory."""
+    stores = {}
+    for kind in ROWS_PER_RECORD:
+        path = vectors_path(directory, kind)
+        if not os.path.exists(path):
+            continue
+        with open(manifest_path(directory, kind), encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("model") != MODEL_NAME:
+            logger.warning(f"Skipping {path}: built with {manifest.get('model')}, serving {MODEL_NAME}")
+            continue
+        stores[kind] = VectorStore(
+            np.load(path, mmap_mode="r"),
+            np.load(hashes_path(directory, kind), mmap_mode="r"),
+            manifest,
+        )
+        logger.info(f"Opened {len(stores[kind])} {kind} vectors from {path}")
+    return stores
+
+
+# Opened at startup when VECTOR_STORE_DIR is set
+vector_store = None
+
+
+def get_vector_store():
+    global vector_store
+    if vector_store is None:
+        vector_store = open_vector_store(VECTOR_STORE_DIR) if VECTOR_STORE_DIR else {}
+    return vector_store
+
+
+def stored_vectors(kind, record_id, texts):
+    """Backfilled vectors for `texts`, or None per text that must be encoded live."""
+    store = get_vector_store().get(kind)
+    if store is None:
+        return [None] * len(texts)
+    return store.lookup(record_id, texts)